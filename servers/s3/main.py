@@ -1,24 +1,110 @@
 from typing import Optional
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from datetime import timedelta
+from decimal import Decimal
+from functools import lru_cache
+from itertools import islice
+from fastapi import FastAPI, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 from os import getenv
+import numpy as np
 import pandas as pd
-import boto3
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+import orjson
+from cachetools import TTLCache
+from aiobotocore.config import AioConfig
+from aiobotocore.session import get_session
+import asyncio
+import copy
 import io
 import logging
 
+logger = logging.getLogger(__name__)
+
 # -----------------
 # Environment variables
 
 AWS_ACCESS_KEY_ID = getenv("AWS_ACCESS_KEY_ID")
 AWS_SECRET_ACCESS_KEY = getenv("AWS_SECRET_ACCESS_KEY")
 AWS_ENDPOINT_URL = getenv("AWS_ENDPOINT_URL")
+BOTO_MAX_POOL_CONNECTIONS = int(getenv("BOTO_MAX_POOL_CONNECTIONS", "50"))
+S3_HEAD_BYTES = int(getenv("S3_HEAD_BYTES", "2097152"))
+S3_PART_BYTES = int(getenv("S3_PART_BYTES", "8388608"))
+S3_PARALLEL_READS = min(int(getenv("S3_PARALLEL_READS", "8")), BOTO_MAX_POOL_CONNECTIONS)
+S3_WARMUP_TIMEOUT = float(getenv("S3_WARMUP_TIMEOUT", "5"))
+S3_CACHE_SIZE = int(getenv("S3_CACHE_SIZE", "1024"))
+S3_CACHE_TTL = int(getenv("S3_CACHE_TTL", "300"))
+
+# Number of records returned by /analyze_s3_object
+ANALYZE_ROWS = 50
+# Number of objects listed by /get_s3_bucket_stats
+BUCKET_SAMPLE_OBJECTS = 100
+# Number of rows parsed at a time when computing CSV statistics
+CSV_CHUNK_ROWS = 100_000
+# Type read_csv gives text columns: str with pandas 3, object before
+CSV_STRING_DTYPE = pd.Series(["text"]).dtype
+
+CSV_PARSE_OPTIONS = pa_csv.ParseOptions(delimiter=';')
+# Treat empty and NA-like strings as nulls, like pandas does
+CSV_CONVERT_OPTIONS = pa_csv.ConvertOptions(strings_can_be_null=True)
+
+# Results of the object endpoints, keyed by (endpoint, bucket, key, ETag).
+# Only accessed from the event loop, so no locking is needed.
+RESULT_CACHE = TTLCache(maxsize=S3_CACHE_SIZE, ttl=S3_CACHE_TTL)
+
+# -----------------
+# S3 client
+
+# Static client settings, built once at import
+S3_CLIENT_CONFIG = AioConfig(
+    signature_version='s3v4',
+    max_pool_connections=BOTO_MAX_POOL_CONNECTIONS,
+    retries={'mode': 'adaptive', 'max_attempts': 5},
+    # Skip the CRC botocore would run over every downloaded body. This trades
+    # end-to-end integrity checks (TLS still protects the transfer) for the
+    # CPU of a full pass over the bytes; ranged GETs are never validated.
+    request_checksum_calculation='when_required',
+    response_checksum_validation='when_required'
+)
+S3_CLIENT_KWARGS = dict(
+    endpoint_url=AWS_ENDPOINT_URL,
+    aws_access_key_id=AWS_ACCESS_KEY_ID,
+    aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
+    aws_session_token=None,
+    config=S3_CLIENT_CONFIG,
+    region_name='us-east-1',
+    verify=True
+)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Open a single async S3 client for the lifetime of the application.
+    The client keeps credentials resolved and its connection pool warm, and
+    is closed on shutdown.
+    """
+    session = get_session()
+    async with session.create_client("s3", **S3_CLIENT_KWARGS) as s3_client:
+        # Pay for DNS resolution and the TLS handshake at startup rather
+        # than on the first request
+        try:
+            await asyncio.wait_for(s3_client.list_buckets(), timeout=S3_WARMUP_TIMEOUT)
+        except Exception as e:
+            logger.warning("Could not warm up the S3 connection: %r", e)
+
+        app.state.s3 = s3_client
+        yield
 
 app = FastAPI(
     title="Utility for analyzing S3 buckets and objects and generating summaries",
     version="1.0.0",
-    description="Accesses an S3 instance buckets and objects"
+    description="Accesses an S3 instance buckets and objects",
+    lifespan=lifespan
 )
 
 origins = ["*"]
@@ -45,32 +131,59 @@ class S3ObjectInput(BaseModel):
     bucket_name: str = Field(..., description="The name of the S3 bucket.")
     object_key: str = Field(..., description="The key (name) of the S3 object.")
 
+class S3ObjectStatsInput(S3ObjectInput):
+    include_tags: bool = Field(False, description="Include the object tags in the statistics metadata.")
+
 class S3BucketInput(BaseModel):
     bucket_name: str = Field(..., description="The name of the S3 bucket.")
     object_prefix: Optional[str] = Field(..., description="The prefix (directory) of the S3 objects.")
+    count_objects: bool = Field(True, description="Count every object under the prefix. If false, only the first objects are listed and num_objects is null.")
+
+# -------------------------------
+# Responses
+# -------------------------------
+
+def orjson_default(value):
+    """
+    Serialize the Arrow scalars orjson does not support natively.
+    Arrow returns nanosecond timestamps as pandas Timestamps.
+    """
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    if isinstance(value, bytes):
+        return value.decode(errors="replace")
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, timedelta):
+        return pd.Timedelta(value).isoformat()
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+class RecordsResponse(JSONResponse):
+    """
+    JSON response rendered with orjson, for payloads of table records.
+    NaN values are rendered as null.
+    """
+
+    def render(self, content):
+        return orjson.dumps(
+            content,
+            default=orjson_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
 
 # -------------------------------
 # Routes
 # -------------------------------
 @app.post(
     "/analyze_s3_object",
-    summary="Analyze an S3 Object"
+    summary="Analyze an S3 Object",
+    response_class=RecordsResponse
 )
-def analyze_s3_object(data: S3ObjectInput):
+async def analyze_s3_object(data: S3ObjectInput, request: Request):
     """
     Analyze a file in an S3 bucket and generate a summary.
     """
-    # Create an S3 client using the provided credentials
-    s3_client = boto3.client(
-        "s3",
-        endpoint_url=AWS_ENDPOINT_URL,
-        aws_access_key_id=AWS_ACCESS_KEY_ID,
-        aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
-        aws_session_token=None,
-        config=boto3.session.Config(signature_version='s3v4'),
-        region_name='us-east-1',
-        verify=True
-    ) 
+    s3_client = request.app.state.s3
 
     try:
         # Check if the key has a valid extension (csv, xlsx, parquet)
@@ -78,15 +191,59 @@ def analyze_s3_object(data: S3ObjectInput):
         if file_extension is None:
             raise ValueError("The file does not have an allowed extension (csv, xlsx or parquet).")
 
+        # The result only depends on the object version, so reuse it while
+        # the ETag is unchanged
+        head = await s3_client.head_object(Bucket=data.bucket_name, Key=data.object_key)
+        cache_key = ("analyze", data.bucket_name, data.object_key, head['ETag'])
+        if cache_key in RESULT_CACHE:
+            return RecordsResponse(RESULT_CACHE[cache_key])
+
         # Get the object from S3
-        response = s3_client.get_object(Bucket=data.bucket_name, Key=data.object_key)
+        if file_extension == "parquet":
+            if head['ContentLength'] <= S3_PART_BYTES:
+                # Small files are fetched whole: one GET is cheaper than a
+                # ranged GET for the footer and each column chunk
+                response = await s3_client.get_object(Bucket=data.bucket_name, Key=data.object_key, IfMatch=head['ETag'])
+                async with response['Body'] as body:
+                    source = io.BytesIO(await body.read())
+            else:
+                # Read through ranged GETs so only the footer and the first
+                # row group are downloaded
+                source = S3RangeReader(s3_client, data.bucket_name, data.object_key, head['ContentLength'], head['ETag'])
+            table = await run_in_threadpool(object_to_table, source, file_extension, ANALYZE_ROWS)
+        else:
+            # Only the first bytes of the object are needed for the preview.
+            # S3 rejects any range on an empty object, so nothing is fetched
+            content = b""
+            if head['ContentLength'] > 0:
+                range_kwargs = {}
+                if head['ContentLength'] > S3_HEAD_BYTES:
+                    range_kwargs["Range"] = f"bytes=0-{S3_HEAD_BYTES - 1}"
+                response = await s3_client.get_object(
+                    Bucket=data.bucket_name,
+                    Key=data.object_key,
+                    IfMatch=head['ETag'],
+                    **range_kwargs
+                )
+                async with response['Body'] as body:
+                    content = await body.read()
 
-        # Convert the value to a pandas dataframe
-        dataframe = object_to_dataframe(response['Body'], file_extension)
-        return {
+            # A truncated range may end in the middle of a row
+            if head['ContentLength'] > S3_HEAD_BYTES:
+                content = content[:content.rfind(b"\n") + 1]
+
+            table = await run_in_threadpool(object_to_table, io.BytesIO(content), file_extension, ANALYZE_ROWS)
+
+        result = {
             "status": 200,
-            "records": dataframe.head(50).to_dict('records')
+            # Arrow converts straight to Python rows, without going through
+            # a pandas dataframe
+            "records": table.to_pylist()
         }
+        RESULT_CACHE[cache_key] = result
+
+        # Returned as a response so FastAPI skips jsonable_encoder
+        return RecordsResponse(result)
     except Exception as e:
         return {
             "message": f"The file could not be processed with error: {e}"
@@ -96,22 +253,12 @@ def analyze_s3_object(data: S3ObjectInput):
     "/get_s3_object_stats",
     summary="Get statistics about a S3 object."
 )
-def get_s3_object_stats(data: S3ObjectInput):
+async def get_s3_object_stats(data: S3ObjectStatsInput, request: Request):
     """
     Get statistics about a S3 object, including number of rows and columns and null value count and data type per column. 
     File size, informations about connection and other S3 headers are also provided.
     """
-    # Create an S3 client using the provided credentials
-    s3_client = boto3.client(
-        "s3",
-        endpoint_url=AWS_ENDPOINT_URL,
-        aws_access_key_id=AWS_ACCESS_KEY_ID,
-        aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
-        aws_session_token=None,
-        config=boto3.session.Config(signature_version='s3v4'),
-        region_name='us-east-1',
-        verify=True
-    ) 
+    s3_client = request.app.state.s3
 
     try:
         # Check if the key has a valid extension (csv, xlsx, parquet)
@@ -119,20 +266,54 @@ def get_s3_object_stats(data: S3ObjectInput):
         if file_extension is None:
             raise ValueError("The file does not have an allowed extension (csv, xlsx or parquet).")
 
-        # Check if the key has a valid extension (csv, xlsx, parquet)
-        tags = s3_client.get_object_tagging(Bucket=data.bucket_name, Key=data.object_key)
+        # The HEAD response provides the object metadata; tags need their own
+        # request, so they are only fetched on demand
+        if data.include_tags:
+            head, tags = await asyncio.gather(
+                s3_client.head_object(Bucket=data.bucket_name, Key=data.object_key),
+                s3_client.get_object_tagging(Bucket=data.bucket_name, Key=data.object_key)
+            )
+        else:
+            head = await s3_client.head_object(Bucket=data.bucket_name, Key=data.object_key)
+            tags = None
 
-        # Get the object from S3
-        response = s3_client.get_object(Bucket=data.bucket_name, Key=data.object_key)
+        metadata = {
+            "ContentLength": head["ContentLength"],
+            "ContentType": head.get("ContentType"),
+            "ETag": head["ETag"],
+            "LastModified": head["LastModified"],
+            "StorageClass": head.get("StorageClass", "STANDARD"),
+            "Metadata": head.get("Metadata", {})
+        }
+        if tags is not None:
+            metadata["TagSet"] = tags["TagSet"]
+
+        # The statistics only depend on the object version, so reuse them
+        # while the ETag is unchanged
+        cache_key = ("stats", data.bucket_name, data.object_key, head['ETag'])
+        stats = RESULT_CACHE.get(cache_key)
+
+        if stats is None:
+            if file_extension == "parquet":
+                # Parquet statistics are read from the file footer, without
+                # downloading or decoding the data pages
+                source = S3RangeReader(s3_client, data.bucket_name, data.object_key, head['ContentLength'], head['ETag'])
+                stats = await run_in_threadpool(get_parquet_statistics, source)
+            elif file_extension == "csv":
+                # Get the object from S3
+                response = await s3_client.get_object(Bucket=data.bucket_name, Key=data.object_key, IfMatch=head['ETag'])
+
+                # Get statistics about the data off the event loop, parsing
+                # the body in chunks so memory does not grow with the file
+                async with response['Body'] as body:
+                    stats = await run_in_threadpool(get_csv_statistics, S3BodyReader(body))
+            else:
+                raise ValueError(f"Unsupported file extension '{file_extension}'")
+            RESULT_CACHE[cache_key] = stats
 
-        # Convert the value to a pandas dataframe
-        dataframe = object_to_dataframe(response['Body'], file_extension)
-        
-        # Get statistics about the data
-        stats = get_object_statistics(dataframe)
         return {
             "status": 200,
-            "metadata": tags,
+            "metadata": metadata,
             "statistics": stats
         }
     except Exception as e:
@@ -146,40 +327,41 @@ def get_s3_object_stats(data: S3ObjectInput):
     "/get_s3_bucket_stats",
     summary="Get statistics about a S3 bucket."
 )
-def get_s3_object_stats(data: S3BucketInput):
+async def get_s3_object_stats(data: S3BucketInput, request: Request):
     """
     Get statistics about a S3 bucket, including object count and the first objects in that bucket.
     """
-    s3_client = boto3.client(
-        "s3",
-        endpoint_url=AWS_ENDPOINT_URL,
-        aws_access_key_id=AWS_ACCESS_KEY_ID,
-        aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
-        aws_session_token=None,
-        config=boto3.session.Config(signature_version='s3v4'),
-        region_name='us-east-1',
-        verify=True
-    ) 
+    s3_client = request.app.state.s3
 
     try:
-        # Get the object from S3
-        if data.object_prefix:
-            response = s3_client.list_objects_v2(Bucket=data.bucket_name, Prefix=data.object_prefix)
-        else:
-            response = s3_client.list_objects_v2(Bucket=data.bucket_name)
+        # List the objects page by page; without a full count, stop once
+        # the sample of objects has been listed
+        pagination_config = {"PageSize": 1000}
+        if not data.count_objects:
+            pagination_config["MaxItems"] = BUCKET_SAMPLE_OBJECTS
+        paginator = s3_client.get_paginator("list_objects_v2")
+        pages = paginator.paginate(
+            Bucket=data.bucket_name,
+            Prefix=data.object_prefix or "",
+            PaginationConfig=pagination_config
+        )
 
         # Get statistics about the data
-        if len(response.get("Contents",[])) > 0:
-            objects = [
+        bucket_name = data.bucket_name
+        num_objects = 0
+        objects = []
+        async for page in pages:
+            bucket_name = page["Name"]
+            num_objects += page["KeyCount"]
+            contents = page.get("Contents", [])
+            objects.extend(
                 {"Key": obj["Key"], "Size": obj["Size"]}
-                for obj in response["Contents"]
-            ]
-        else:
-            objects = []
+                for obj in islice(contents, BUCKET_SAMPLE_OBJECTS - len(objects))
+            )
         return {
             "status": 200,
-            "bucket_name": response['Name'],
-            "num_objects": response["KeyCount"],
+            "bucket_name": bucket_name,
+            "num_objects": num_objects if data.count_objects else None,
             "objects": objects
         }
     except Exception as e:
@@ -193,48 +375,342 @@ def get_s3_object_stats(data: S3BucketInput):
 # Utilitary functions
 # ------------------------------------------------
 
+@lru_cache(maxsize=1024)
 def get_file_extension(object_key):
     """
     Get the extension of a file from its object key.
+    Returns None if the file name has no extension.
     """
-    # Split the object key into parts using '/' as the delimiter
-    extension = object_key.split('.')[-1]
-    if extension is not None:
-        return extension
+    # Only look at the file name, not at dots in the directories
+    file_name = object_key.rpartition('/')[2]
+    _, dot, extension = file_name.rpartition('.')
+    if dot:
+        return extension.lower()
     return None
 
-def object_to_dataframe(data, file_extension):
+class S3BodyReader(io.RawIOBase):
+    """
+    Blocking file-like view over an aiobotocore streaming body.
+    It must be created on the event loop and read from another thread
+    (e.g. through run_in_threadpool): every read awaits the next chunk of
+    the body on the loop, so parsers can consume the object incrementally.
+    """
+
+    def __init__(self, body):
+        self._body = body
+        self._loop = asyncio.get_running_loop()
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        chunk = asyncio.run_coroutine_threadsafe(self._body.read(len(buffer)), self._loop).result()
+        buffer[:len(chunk)] = chunk
+        return len(chunk)
+
+class S3RangeReader(io.RawIOBase):
+    """
+    Seekable, blocking file-like view over an S3 object.
+    Every read issues a ranged GET on the event loop, so formats that need
+    random access (Parquet) only download the parts they actually read.
+    Reads are pinned to the given ETag so they all see the same version.
+    Like S3BodyReader, it must be created on the event loop and read from
+    another thread.
+    """
+
+    def __init__(self, s3_client, bucket_name, object_key, size, etag):
+        self._s3_client = s3_client
+        self._bucket_name = bucket_name
+        self._object_key = object_key
+        self._size = size
+        self._etag = etag
+        self._position = 0
+        self._loop = asyncio.get_running_loop()
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            self._position = offset
+        elif whence == io.SEEK_CUR:
+            self._position += offset
+        elif whence == io.SEEK_END:
+            self._position = self._size + offset
+        else:
+            raise ValueError(f"Invalid whence '{whence}'")
+        return self._position
+
+    def readinto(self, buffer):
+        if self._position >= self._size or len(buffer) == 0:
+            return 0
+        end = min(self._position + len(buffer), self._size) - 1
+        chunk = asyncio.run_coroutine_threadsafe(self._read_range(self._position, end), self._loop).result()
+        buffer[:len(chunk)] = chunk
+        self._position += len(chunk)
+        return len(chunk)
+
+    async def _read_range(self, start, end):
+        if end - start < S3_PART_BYTES:
+            return await self._get_range(start, end)
+
+        # Large reads are split into parts downloaded concurrently, since a
+        # single S3 connection is much slower than the bucket's throughput
+        parts = [
+            (part_start, min(part_start + S3_PART_BYTES, end + 1) - 1)
+            for part_start in range(start, end + 1, S3_PART_BYTES)
+        ]
+        semaphore = asyncio.Semaphore(S3_PARALLEL_READS)
+
+        async def guarded(part_start, part_end):
+            async with semaphore:
+                return await self._get_range(part_start, part_end)
+
+        chunks = await asyncio.gather(*(guarded(*part) for part in parts))
+        return b"".join(chunks)
+
+    async def _get_range(self, start, end):
+        response = await self._s3_client.get_object(
+            Bucket=self._bucket_name,
+            Key=self._object_key,
+            IfMatch=self._etag,
+            Range=f"bytes={start}-{end}"
+        )
+        async with response['Body'] as body:
+            return await body.read()
+
+def get_pandas_index_columns(schema):
+    """
+    Get the names of the columns pandas stored a dataframe index in.
+    Range indexes are only kept in the metadata and are not listed.
+    """
+    pandas_metadata = schema.pandas_metadata or {}
+    return [name for name in pandas_metadata.get("index_columns", []) if isinstance(name, str)]
+
+def get_csv_column_names(header):
+    """
+    Get the column names of a CSV header line, renaming duplicates
+    to name.1, name.2, ... the way pandas does.
+    """
+
+    return pd.read_csv(io.BytesIO(header), sep=';', engine='c', nrows=0).columns.tolist()
+
+def read_csv_head(body, nrows):
+    """
+    Read the first nrows rows of a seekable CSV body into an Arrow table.
+    """
+
+    read_options = pa_csv.ReadOptions(column_names=get_csv_column_names(body.readline()), skip_rows=1)
+    body.seek(0)
+    try:
+        # Arrow's multithreaded reader only parses the first blocks
+        reader = pa_csv.open_csv(
+            body, read_options=read_options, parse_options=CSV_PARSE_OPTIONS, convert_options=CSV_CONVERT_OPTIONS
+        )
+
+        # Arrow infers dates and times that pandas returns as written, so
+        # the body is read again with those columns kept as strings
+        temporal_columns = {field.name: pa.string() for field in reader.schema if pa.types.is_temporal(field.type)}
+        if temporal_columns:
+            convert_options = copy.copy(CSV_CONVERT_OPTIONS)
+            convert_options.column_types = temporal_columns
+            body.seek(0)
+            reader = pa_csv.open_csv(
+                body, read_options=read_options, parse_options=CSV_PARSE_OPTIONS, convert_options=convert_options
+            )
+
+        batches = []
+        rows = 0
+        for batch in reader:
+            batches.append(batch)
+            rows += batch.num_rows
+            if rows >= nrows:
+                break
+        return pa.Table.from_batches(batches, schema=reader.schema).slice(0, nrows)
+    except pa.ArrowInvalid:
+        # Arrow rejects rows with missing fields, which pandas fills with nulls
+        body.seek(0)
+        frame = pd.read_csv(body, sep=';', engine='c', nrows=nrows)
+        return pa.Table.from_pandas(frame, preserve_index=False)
+
+def read_parquet_head(body, nrows):
+    """
+    Read the first nrows rows of a seekable Parquet body into an Arrow table.
+    """
+
+    # Pre-buffering coalesces the column chunks of the row groups read
+    # into a few large reads, which S3RangeReader downloads as concurrent
+    # parts
+    parquet_file = pq.ParquetFile(body, pre_buffer=True)
+
+    # The index pandas stored as columns is not part of the records
+    index_columns = get_pandas_index_columns(parquet_file.schema_arrow)
+    columns = [name for name in parquet_file.schema_arrow.names if name not in index_columns]
+
+    # Only the row groups holding the first nrows rows are buffered
+    row_groups = []
+    rows = 0
+    for i in range(parquet_file.num_row_groups):
+        if rows >= nrows:
+            break
+        row_groups.append(i)
+        rows += parquet_file.metadata.row_group(i).num_rows
+
+    # Decode a single batch
+    batch = next(parquet_file.iter_batches(batch_size=nrows, row_groups=row_groups, columns=columns), None)
+    if batch is None:
+        return parquet_file.schema_arrow.empty_table().drop_columns(index_columns)
+    return pa.Table.from_batches([batch])
+
+# Preview reader for each supported file extension
+TABLE_READERS = {
+    "csv": read_csv_head,
+    "parquet": read_parquet_head,
+}
+
+def object_to_table(body, file_extension, nrows):
     """
-    Convert an S3 object to a pandas dataframe.
+    Read the first nrows rows of an S3 object body into an Arrow table.
+    For Parquet the body must be seekable, such as S3RangeReader.
     """
 
-    if file_extension == "csv":
-        # Read the CSV data into a pandas DataFrame
-        df = pd.read_csv(io.BytesIO(data.read()), sep=';')
-        return df
-    elif file_extension == "parquet":
-        df = pd.read_parquet(io.BytesIO(data.read()))
-        return df
-    else:
+    reader = TABLE_READERS.get(file_extension)
+    if reader is None:
         raise ValueError(f"Unsupported file extension '{file_extension}'")
+    return reader(body, nrows)
+
+def promote_csv_dtype(dtype, other):
+    """
+    Get the type read_csv infers for a column holding the values of two
+    chunks it inferred as dtype and other.
+    """
+    if dtype == other:
+        return dtype
+    if all(pd.api.types.is_integer_dtype(t) or pd.api.types.is_float_dtype(t) for t in (dtype, other)):
+        return np.result_type(dtype, other)
+    # Booleans mixed with nulls are read as objects
+    if all(pd.api.types.is_bool_dtype(t) or pd.api.types.is_object_dtype(t) for t in (dtype, other)):
+        return np.dtype(object)
+    return CSV_STRING_DTYPE
 
-def get_object_statistics(data : pd.DataFrame):
+def get_object_statistics(chunks):
     """
-    Get the statistics of an S3 object.
+    Get the statistics of a CSV S3 object from an iterable of dataframe chunks.
+    Row and null counts are summed across chunks and the column types are
+    promoted to the ones a single read_csv of the whole object would infer.
     """
 
-    columns = list(data.columns)
+    rows = 0
+    null_counts = None
+    first_types = None
+    value_types = {}
+    for chunk in chunks:
+        rows += len(chunk)
+        # A single pass over the chunk for every column's null count
+        chunk_null_counts = chunk.isna().sum()
+        if null_counts is None:
+            null_counts = chunk_null_counts
+            first_types = chunk.dtypes
+        else:
+            null_counts = null_counts + chunk_null_counts
+
+        # Columns with only nulls in this chunk carry no type information
+        for col, dtype in chunk.dtypes.items():
+            if chunk_null_counts[col] == len(chunk):
+                continue
+            current = value_types.get(col)
+            value_types[col] = dtype if current is None else promote_csv_dtype(current, dtype)
+
+    if null_counts is None:
+        return {"rows": {"count": 0}, "columns": []}
+
     column_types = {}
+    for col in first_types.index:
+        dtype = value_types.get(col)
+        if dtype is None:
+            # Columns without any value keep the type pandas gives to nulls
+            dtype = first_types[col]
+        elif null_counts[col] and pd.api.types.is_integer_dtype(dtype):
+            dtype = np.dtype("float64")
+        elif null_counts[col] and pd.api.types.is_bool_dtype(dtype):
+            dtype = np.dtype(object)
+        column_types[col] = dtype
+
     stats = {
         "rows": {
-            "count": len(data.index),
+            "count": rows,
         },
         "columns": [
             {
                 "name": col,
-                "type": str(data[col].dtype),
-                "null_value_count": int(data[col].isnull().sum())
-            } for col in columns
+                "type": str(column_types[col]),
+                "null_value_count": int(null_counts[col])
+            } for col in first_types.index
+        ]
+    }
+    return stats
+
+def get_csv_statistics(body):
+    """
+    Get the statistics of a CSV S3 object, reading it in chunks.
+    """
+
+    # Arrow's streaming reader fixes column types from the first block, so
+    # pandas is used here to widen them when later chunks need it
+    reader = pd.read_csv(io.BufferedReader(body), sep=';', engine='c', chunksize=CSV_CHUNK_ROWS)
+    with reader:
+        return get_object_statistics(reader)
+
+def get_parquet_statistics(source):
+    """
+    Get the statistics of a Parquet S3 object from its footer metadata.
+    Null counts are summed from the row group statistics; columns without
+    them are the only ones actually read.
+    """
+
+    parquet_file = pq.ParquetFile(source)
+    metadata = parquet_file.metadata
+    # The index pandas stored as columns is not reported as data
+    index_columns = get_pandas_index_columns(parquet_file.schema_arrow)
+    schema = parquet_file.schema_arrow.remove_metadata()
+    names = [name for name in schema.names if name not in index_columns]
+    column_types = schema.empty_table().select(names).to_pandas().dtypes
+
+    null_counts = {}
+    unknown = set()
+    for i in range(metadata.num_row_groups):
+        row_group = metadata.row_group(i)
+        for j in range(row_group.num_columns):
+            column = row_group.column(j)
+            name = column.path_in_schema
+            if column.statistics is None or not column.statistics.has_null_count:
+                unknown.add(name)
+            else:
+                null_counts[name] = null_counts.get(name, 0) + column.statistics.null_count
+
+    # Nested columns or files written without statistics need a scan
+    missing = [name for name in names if name in unknown or name not in null_counts]
+    if missing:
+        table = parquet_file.read(columns=missing)
+        for name in missing:
+            null_counts[name] = table.column(name).null_count
+
+    stats = {
+        "rows": {
+            "count": metadata.num_rows,
+        },
+        "columns": [
+            {
+                "name": name,
+                "type": str(column_types[name]),
+                "null_value_count": int(null_counts[name])
+            } for name in names
         ]
     }
     return stats
@@ -0,0 +1,49 @@
+import io
+
+import pandas as pd
+import pytest
+
+import main
+
+# Columns whose values change type between chunks of two rows
+CSV_COLUMNS = {
+    "text_then_empty": ["x", "y", "", ""],
+    "int_then_text": ["1", "2", "x", "y"],
+    "bool_then_int": ["True", "False", "1", "2"],
+    "int_then_float": ["1", "2", "1.5", "2"],
+    "int_then_empty": ["1", "2", "", ""],
+    "empty_then_int": ["", "", "1", "2"],
+    "bool_then_empty": ["True", "False", "", ""],
+    "bool_empty_then_text": ["True", "", "x", "y"],
+    "bool_empty_then_bool": ["True", "", "False", "True"],
+    "int_empty_then_bool": ["1", "", "True", "False"],
+    "empty": ["", "", "", ""],
+}
+
+@pytest.mark.parametrize("name, values", CSV_COLUMNS.items())
+def test_csv_statistics_match_a_full_read(monkeypatch, name, values):
+    # A second column keeps rows with an empty value from being skipped
+    content = f"{name};other\n" + "".join(f"{value};0\n" for value in values)
+    monkeypatch.setattr(main, "CSV_CHUNK_ROWS", 2)
+
+    stats = main.get_csv_statistics(io.BytesIO(content.encode()))
+
+    frame = pd.read_csv(io.StringIO(content), sep=';')
+    assert stats == {
+        "rows": {"count": len(frame)},
+        "columns": [
+            {"name": col, "type": str(frame[col].dtype), "null_value_count": int(frame[col].isna().sum())}
+            for col in frame.columns
+        ]
+    }
+
+def test_csv_statistics_of_header_only_file():
+    stats = main.get_csv_statistics(io.BytesIO(b"a;b\n"))
+
+    assert stats == {
+        "rows": {"count": 0},
+        "columns": [
+            {"name": "a", "type": "object", "null_value_count": 0},
+            {"name": "b", "type": "object", "null_value_count": 0}
+        ]
+    }